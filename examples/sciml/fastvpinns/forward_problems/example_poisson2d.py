@@ -34,8 +34,8 @@ Versions:
 
 # Common library imports
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.tri as mtri
 from pathlib import Path
 import tensorflow as tf
 import time
@@ -45,6 +45,7 @@ from tqdm import tqdm
 from scirex.core.sciml.geometry.geometry_2d import Geometry_2D
 from scirex.core.sciml.fe.fespace2d import Fespace2D
 from scirex.core.sciml.fastvpinns.data.datahandler2d import DataHandler2D
+from scirex.core.sciml.utils.compute_utils import compute_errors_combined
 
 i_mesh_type = "quadrilateral"  # "quadrilateral"
 i_mesh_generation_method = "internal"  # "internal" or "external"
@@ -84,33 +85,10 @@ i_num_epochs = 20000
 
 
 ## Setting up boundary conditions
-def left_boundary(x, y):
+def boundary(x, y):
     """
-    This function will return the boundary value for given component of a boundary
-    """
-    val = 0.0
-    return np.ones_like(x) * val
-
-
-def right_boundary(x, y):
-    """
-    This function will return the boundary value for given component of a boundary
-    """
-    val = 0.0
-    return np.ones_like(x) * val
-
-
-def top_boundary(x, y):
-    """
-    This function will return the boundary value for given component of a boundary
-    """
-    val = 0.0
-    return np.ones_like(x) * val
-
-
-def bottom_boundary(x, y):
-    """
-    This function will return the boundary value for given component of a boundary
+    This function will return the boundary value for given component of a boundary.
+    The same value is prescribed on all the four boundaries.
     """
     val = 0.0
     return np.ones_like(x) * val
@@ -146,10 +124,10 @@ def get_boundary_function_dict():
     This function will return a dictionary of boundary functions
     """
     return {
-        1000: bottom_boundary,
-        1001: right_boundary,
-        1002: top_boundary,
-        1003: left_boundary,
+        1000: boundary,
+        1001: boundary,
+        1002: boundary,
+        1003: boundary,
     }
 
 
@@ -173,8 +151,7 @@ def get_bilinear_params_dict():
 # use pathlib to create the folder,if it does not exist
 folder = Path(i_output_path)
 # create the folder if it does not exist
-if not folder.exists():
-    folder.mkdir(parents=True, exist_ok=True)
+folder.mkdir(parents=True, exist_ok=True)
 
 
 # get the boundary function dictionary from example file
@@ -223,9 +200,6 @@ fespace = Fespace2D(
 # instantiate data handler
 datahandler = DataHandler2D(fespace, domain, dtype=i_dtype)
 
-params_dict = {}
-params_dict["n_cells"] = fespace.n_cells
-
 from scirex.core.sciml.fastvpinns.model.model import DenseModel
 from scirex.core.sciml.fastvpinns.physics.poisson2d import pde_loss_poisson
 
@@ -282,13 +256,18 @@ test_points = domain.get_test_points()
 print(f"[bold]Number of Test Points = [/bold] {test_points.shape[0]}")
 y_exact = exact_solution(test_points[:, 0], test_points[:, 1])
 
+
 # Get predicted values from the model
-y_pred = model(test_points).numpy()
-y_pred = y_pred.reshape(-1)
+# the model is evaluated eagerly, since it is called only once here and an XLA
+# compile of the forward pass would take longer than the evaluation itself
+y_pred = tf.reshape(model(test_points), [-1]).numpy()
 
 # compute the error
 error = np.abs(y_exact - y_pred)
 
+# triangulate the test points once and reuse it for all the contour plots
+triangulation = mtri.Triangulation(test_points[:, 0], test_points[:, 1])
+
 # plot a 2x2 Grid, loss plot, exact solution, predicted solution and error
 fig, axs = plt.subplots(2, 2, figsize=(10, 8))
 
@@ -301,7 +280,7 @@ axs[0, 0].set_yscale("log")
 
 # exact solution
 # contour plot of the exact solution
-axs[0, 1].tricontourf(test_points[:, 0], test_points[:, 1], y_exact, 100)
+axs[0, 1].tricontourf(triangulation, y_exact, 100)
 axs[0, 1].set_title("Exact Solution")
 axs[0, 1].set_xlabel("x")
 axs[0, 1].set_ylabel("y")
@@ -311,7 +290,7 @@ cbar = plt.colorbar(axs[0, 1].collections[0], ax=axs[0, 1])
 
 # predicted solution
 # contour plot of the predicted solution
-axs[1, 0].tricontourf(test_points[:, 0], test_points[:, 1], y_pred, 100)
+axs[1, 0].tricontourf(triangulation, y_pred, 100)
 axs[1, 0].set_title("Predicted Solution")
 axs[1, 0].set_xlabel("x")
 axs[1, 0].set_ylabel("y")
@@ -320,7 +299,7 @@ cbar = plt.colorbar(axs[1, 0].collections[0], ax=axs[1, 0])
 
 # error plot
 # contour plot of the error
-axs[1, 1].tricontourf(test_points[:, 0], test_points[:, 1], error, 100)
+axs[1, 1].tricontourf(triangulation, error, 100)
 axs[1, 1].set_title("Error")
 axs[1, 1].set_xlabel("x")
 axs[1, 1].set_ylabel("y")
@@ -333,22 +312,18 @@ plt.savefig("results.png")
 
 
 # print error statistics
-l2_error = np.sqrt(np.mean(error**2))
-l1_error = np.mean(np.abs(error))
-l_inf_error = np.max(np.abs(error))
-rel_l2_error = l2_error / np.sqrt(np.mean(y_exact**2))
-rel_l1_error = l1_error / np.mean(np.abs(y_exact))
-rel_l_inf_error = l_inf_error / np.max(np.abs(y_exact))
-
-# print the error statistics in a formatted table
-error_df = pd.DataFrame(
-    {
-        "L2 Error": [l2_error],
-        "L1 Error": [l1_error],
-        "L_inf Error": [l_inf_error],
-        "Relative L2 Error": [rel_l2_error],
-        "Relative L1 Error": [rel_l1_error],
-        "Relative L_inf Error": [rel_l_inf_error],
-    }
+(
+    l2_error,
+    l_inf_error,
+    rel_l2_error,
+    rel_l_inf_error,
+    l1_error,
+    rel_l1_error,
+) = compute_errors_combined(y_exact, y_pred)
+
+# print the error statistics
+print(
+    f"L2 Error: {l2_error:.4e}, L1 Error: {l1_error:.4e}, L_inf Error: {l_inf_error:.4e}",
+    f"Relative L2 Error: {rel_l2_error:.4e}, Relative L1 Error: {rel_l1_error:.4e}, Relative L_inf Error: {rel_l_inf_error:.4e}",
+    sep="\n",
 )
-print(error_df)
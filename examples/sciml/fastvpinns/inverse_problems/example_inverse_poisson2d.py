@@ -34,8 +34,8 @@ Versions:
 
 # Common library imports
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.tri as mtri
 from pathlib import Path
 import tensorflow as tf
 import time
@@ -45,6 +45,7 @@ from tqdm import tqdm
 from scirex.core.sciml.geometry.geometry_2d import Geometry_2D
 from scirex.core.sciml.fe.fespace2d import Fespace2D
 from scirex.core.sciml.fastvpinns.data.datahandler2d import DataHandler2D
+from scirex.core.sciml.utils.compute_utils import compute_errors_combined
 
 # Section: Inputs
 
@@ -92,33 +93,10 @@ i_num_epochs = 5000
 EPS = 0.3
 
 
-def left_boundary(x, y):
+def boundary(x, y):
     """
-    This function will return the boundary value for given component of a boundary
-    """
-    val = np.sin(x) * np.tanh(x) * np.exp(-1.0 * EPS * (x**2)) * 10
-    return val
-
-
-def right_boundary(x, y):
-    """
-    This function will return the boundary value for given component of a boundary
-    """
-    val = np.sin(x) * np.tanh(x) * np.exp(-1.0 * EPS * (x**2)) * 10
-    return val
-
-
-def top_boundary(x, y):
-    """
-    This function will return the boundary value for given component of a boundary
-    """
-    val = np.sin(x) * np.tanh(x) * np.exp(-1.0 * EPS * (x**2)) * 10
-    return val
-
-
-def bottom_boundary(x, y):
-    """
-    This function will return the boundary value for given component of a boundary
+    This function will return the boundary value for given component of a boundary.
+    The same value is prescribed on all the four boundaries.
     """
     val = np.sin(x) * np.tanh(x) * np.exp(-1.0 * EPS * (x**2)) * 10
     return val
@@ -133,15 +111,21 @@ def rhs(x, y):
     Y = y
     eps = EPS
 
+    # evaluate the transcendental terms once and reuse them below
+    sin_x = np.sin(X)
+    cos_x = np.cos(X)
+    tanh_x = np.tanh(X)
+    tanh_sq_minus_1 = tanh_x**2 - 1
+
     return (
         -EPS
         * (
-            40.0 * X * eps * (np.tanh(X) ** 2 - 1) * np.sin(X)
-            - 40.0 * X * eps * np.cos(X) * np.tanh(X)
-            + 10 * eps * (4.0 * X**2 * eps - 2.0) * np.sin(X) * np.tanh(X)
-            + 20 * (np.tanh(X) ** 2 - 1) * np.sin(X) * np.tanh(X)
-            - 20 * (np.tanh(X) ** 2 - 1) * np.cos(X)
-            - 10 * np.sin(X) * np.tanh(X)
+            40.0 * X * eps * tanh_sq_minus_1 * sin_x
+            - 40.0 * X * eps * cos_x * tanh_x
+            + 10 * eps * (4.0 * X**2 * eps - 2.0) * sin_x * tanh_x
+            + 20 * tanh_sq_minus_1 * sin_x * tanh_x
+            - 20 * tanh_sq_minus_1 * cos_x
+            - 10 * sin_x * tanh_x
         )
         * np.exp(-1.0 * X**2 * eps)
     )
@@ -162,10 +146,10 @@ def get_boundary_function_dict():
     This function will return a dictionary of boundary functions
     """
     return {
-        1000: bottom_boundary,
-        1001: right_boundary,
-        1002: top_boundary,
-        1003: left_boundary,
+        1000: boundary,
+        1001: boundary,
+        1002: boundary,
+        1003: boundary,
     }
 
 
@@ -210,8 +194,7 @@ def get_inverse_params_actual_dict():
 # use pathlib to create the folder,if it does not exist
 folder = Path(i_output_path)
 # create the folder if it does not exist
-if not folder.exists():
-    folder.mkdir(parents=True, exist_ok=True)
+folder.mkdir(parents=True, exist_ok=True)
 
 
 # get the boundary function dictionary from example file
@@ -260,9 +243,6 @@ fespace = Fespace2D(
 # instantiate data handler
 datahandler = DataHandler2D(fespace, domain, dtype=i_dtype)
 
-params_dict = {}
-params_dict["n_cells"] = fespace.n_cells
-
 from scirex.core.sciml.fastvpinns.model.model_inverse import DenseModel_Inverse
 from scirex.core.sciml.fastvpinns.physics.poisson2d_inverse import (
     pde_loss_poisson_inverse,
@@ -326,6 +306,36 @@ model = DenseModel_Inverse(
     activation=i_activation,
 )
 
+
+# keep the test points and the exact solution on the device, so that the test
+# errors are computed in a single compiled call during training
+test_points_tensor = tf.constant(test_points, dtype=i_dtype)
+y_exact_tensor = tf.reshape(tf.constant(y_exact, dtype=i_dtype), [-1, 1])
+
+# the number of test points is fixed, so the compiled test error function is
+# specialised to the exact shape of the test grid
+test_points_spec = tf.TensorSpec(shape=[test_points.shape[0], 2], dtype=i_dtype)
+
+
+@tf.function(
+    jit_compile=True,
+    input_signature=[
+        test_points_spec,
+        tf.TensorSpec(shape=[test_points.shape[0], 1], dtype=i_dtype),
+    ],
+)
+def compute_test_errors(x, y_true):
+    """
+    This function will return the error norms of the model on the test points
+    """
+    error = tf.abs(model(x) - y_true)
+    return (
+        tf.sqrt(tf.reduce_mean(tf.square(error))),
+        tf.reduce_mean(error),
+        tf.reduce_max(error),
+    )
+
+
 loss_array = []  # total loss
 time_array = []  # time taken for each epoch
 inverse_params_array = []  # inverse parameters
@@ -344,40 +354,40 @@ for epoch in tqdm(range(i_num_epochs), desc="Training Model"):
     inverse_params_array.append(loss["inverse_params"]["eps"].numpy())
     sensor_loss_array.append(loss["sensor_loss"])
 
-    y_pred_test = model(test_points).numpy().reshape(-1)
-    error = np.abs(y_exact - y_pred_test)
-
-    l2_error = np.sqrt(np.mean(error**2))
-    l1_error = np.mean(np.abs(error))
-    l_inf_error = np.max(np.abs(error))
+    if epoch % 1000 == 0:
+        l2_error, l1_error, l_inf_error = compute_test_errors(
+            test_points_tensor, y_exact_tensor
+        )
 
-    loss_pde = float(loss["loss_pde"].numpy())
-    loss_dirichlet = float(loss["loss_dirichlet"].numpy())
-    total_loss = float(loss["loss"].numpy())
+        loss_pde = float(loss["loss_pde"].numpy())
+        loss_dirichlet = float(loss["loss_dirichlet"].numpy())
+        total_loss = float(loss["loss"].numpy())
 
-    if epoch % 1000 == 0:
         print(f"Epoch: {epoch}")
         print(
             f"Variational Losses   || Pde Loss: {loss_pde:.3e} Dirichlet Loss: {loss_dirichlet:.3e} Total Loss: {total_loss:.3e}"
         )
+        print(
+            f"Test Errors          || L2 Error: {float(l2_error):.3e} L1 Error: {float(l1_error):.3e} L_inf Error: {float(l_inf_error):.3e}"
+        )
         print(
             f"Predicted Parameter  || {loss['inverse_params']['eps'].numpy():.3e}",
             f"Actual Parameter: {actual_epsilon:.3e}",
             f"Sensor Loss: {float(loss['sensor_loss'].numpy()):.3e}",
         )
 
-# predict the values for the test points
-test_points = domain.get_test_points()
-print(f"[bold]Number of Test Points = [/bold] {test_points.shape[0]}")
-y_exact = exact_solution(test_points[:, 0], test_points[:, 1])
 
 # Get predicted values from the model
-y_pred = model(test_points).numpy()
-y_pred = y_pred.reshape(-1)
+# the model is evaluated eagerly, since it is called only once here and an XLA
+# compile of the forward pass would take longer than the evaluation itself
+y_pred = tf.reshape(model(test_points_tensor), [-1]).numpy()
 
 # compute the error
 error = np.abs(y_exact - y_pred)
 
+# triangulate the test points once and reuse it for all the contour plots
+triangulation = mtri.Triangulation(test_points[:, 0], test_points[:, 1])
+
 # plot a 2x2 Grid, loss plot, exact solution, predicted solution and error
 fig, axs = plt.subplots(3, 2, figsize=(10, 12))
 
@@ -390,7 +400,7 @@ axs[0, 0].set_yscale("log")
 
 # exact solution
 # contour plot of the exact solution
-axs[0, 1].tricontourf(test_points[:, 0], test_points[:, 1], y_exact, 100)
+axs[0, 1].tricontourf(triangulation, y_exact, 100)
 axs[0, 1].set_title("Exact Solution")
 axs[0, 1].set_xlabel("x")
 axs[0, 1].set_ylabel("y")
@@ -406,7 +416,7 @@ cbar.set_ticks([y_exact.min(), (y_exact.min() + y_exact.max()) / 2, y_exact.max(
 
 # predicted solution
 # contour plot of the predicted solution
-axs[1, 0].tricontourf(test_points[:, 0], test_points[:, 1], y_pred, 100)
+axs[1, 0].tricontourf(triangulation, y_pred, 100)
 axs[1, 0].set_title("Predicted Solution")
 axs[1, 0].set_xlabel("x")
 axs[1, 0].set_ylabel("y")
@@ -417,7 +427,7 @@ cbar.set_ticks([y_pred.min(), (y_pred.min() + y_pred.max()) / 2, y_pred.max()])
 
 # error plot
 # contour plot of the error
-axs[1, 1].tricontourf(test_points[:, 0], test_points[:, 1], error, 100)
+axs[1, 1].tricontourf(triangulation, error, 100)
 axs[1, 1].set_title("Error")
 axs[1, 1].set_xlabel("x")
 axs[1, 1].set_ylabel("y")
@@ -448,22 +458,18 @@ plt.savefig("results.png")
 
 
 # print error statistics
-l2_error = np.sqrt(np.mean(error**2))
-l1_error = np.mean(np.abs(error))
-l_inf_error = np.max(np.abs(error))
-rel_l2_error = l2_error / np.sqrt(np.mean(y_exact**2))
-rel_l1_error = l1_error / np.mean(np.abs(y_exact))
-rel_l_inf_error = l_inf_error / np.max(np.abs(y_exact))
-
-# print the error statistics in a formatted table
-error_df = pd.DataFrame(
-    {
-        "L2 Error": [l2_error],
-        "L1 Error": [l1_error],
-        "L_inf Error": [l_inf_error],
-        "Relative L2 Error": [rel_l2_error],
-        "Relative L1 Error": [rel_l1_error],
-        "Relative L_inf Error": [rel_l_inf_error],
-    }
+(
+    l2_error,
+    l_inf_error,
+    rel_l2_error,
+    rel_l_inf_error,
+    l1_error,
+    rel_l1_error,
+) = compute_errors_combined(y_exact, y_pred)
+
+# print the error statistics
+print(
+    f"L2 Error: {l2_error:.4e}, L1 Error: {l1_error:.4e}, L_inf Error: {l_inf_error:.4e}",
+    f"Relative L2 Error: {rel_l2_error:.4e}, Relative L1 Error: {rel_l1_error:.4e}, Relative L_inf Error: {rel_l_inf_error:.4e}",
+    sep="\n",
 )
-print(error_df)
@@ -169,30 +169,29 @@ print(f"Test MSE: {test_error:.6f}")
 output_dir = os.path.join(os.path.dirname(__file__), "outputs", "wave")
 os.makedirs(output_dir, exist_ok=True)
 
-plt.figure()
-plt.plot(spatial_grid, test_x[0, 0], label="Initial displacement")
-plt.plot(spatial_grid, test_x[0, 1], label="Initial velocity")
-plt.plot(spatial_grid, test_y[0, 0], label="True solution")
-plt.plot(spatial_grid, test_pred[0, 0], "--", label="FNO prediction")
-plt.legend()
-plt.title("Example prediction")
-plt.xlabel("x")
-plt.ylabel("Displacement")
-output_file = os.path.join(output_dir, "example_prediction.png")
-plt.savefig(output_file)
-
-plt.figure()
-plt.semilogy(losses)
-plt.title("Training loss")
-plt.xlabel("Step")
-plt.ylabel("MSE")
-output_file = os.path.join(output_dir, "training_loss.png")
-plt.savefig(output_file)
-
-plt.figure()
-plt.plot(spatial_grid, jnp.abs(test_pred[0, 0] - test_y[0, 0]))
-plt.title("Absolute error")
-plt.xlabel("x")
-plt.ylabel("|Error|")
-output_file = os.path.join(output_dir, "absolute_error.png")
-plt.savefig(output_file)
+# Draw the three panels on one figure so it is set up and saved once
+fig, axs = plt.subplots(1, 3, figsize=(18, 5))
+
+axs[0].plot(spatial_grid, test_x[0, 0], label="Initial displacement")
+axs[0].plot(spatial_grid, test_x[0, 1], label="Initial velocity")
+axs[0].plot(spatial_grid, test_y[0, 0], label="True solution")
+axs[0].plot(spatial_grid, test_pred[0, 0], "--", label="FNO prediction")
+axs[0].legend()
+axs[0].set_title("Example prediction")
+axs[0].set_xlabel("x")
+axs[0].set_ylabel("Displacement")
+
+axs[1].semilogy(losses)
+axs[1].set_title("Training loss")
+axs[1].set_xlabel("Step")
+axs[1].set_ylabel("MSE")
+
+axs[2].plot(spatial_grid, jnp.abs(test_pred[0, 0] - test_y[0, 0]))
+axs[2].set_title("Absolute error")
+axs[2].set_xlabel("x")
+axs[2].set_ylabel("|Error|")
+
+fig.tight_layout()
+output_file = os.path.join(output_dir, "results.png")
+fig.savefig(output_file)
+plt.close(fig)
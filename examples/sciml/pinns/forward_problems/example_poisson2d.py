@@ -34,8 +34,8 @@ Versions:
 
 # Common library imports
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.tri as mtri
 from pathlib import Path
 import tensorflow as tf
 import time
@@ -46,6 +46,7 @@ from pyDOE import lhs
 from scirex.core.sciml.geometry.geometry_2d import Geometry_2D
 from scirex.core.sciml.fe.fespace2d import Fespace2D
 from scirex.core.sciml.fastvpinns.data.datahandler2d import DataHandler2D
+from scirex.core.sciml.utils.compute_utils import compute_errors_combined
 from scirex.core.sciml.pinns.model.model import DenseModel
 from scirex.core.sciml.pinns.physics.poisson2d import pde_loss_poisson2d
 
@@ -247,8 +248,7 @@ plt.savefig("input_points.png")
 # use pathlib to create the folder,if it does not exist
 folder = Path(i_output_path)
 # create the folder if it does not exist
-if not folder.exists():
-    folder.mkdir(parents=True, exist_ok=True)
+folder.mkdir(parents=True, exist_ok=True)
 
 
 model = DenseModel(
@@ -266,6 +266,30 @@ model = DenseModel(
 )
 
 
+# keep the exact solution on the device, so that the test errors are computed
+# in a single compiled call during training
+exact_values_tensor = tf.reshape(tf.constant(exact_values, dtype=i_dtype), [-1, 1])
+
+# the number of test points is fixed, so the compiled test error function is
+# specialised to the exact shape of the test grid
+test_points_spec = tf.TensorSpec(shape=[test_points.shape[0], 2], dtype=i_dtype)
+
+
+@tf.function(
+    jit_compile=True,
+    input_signature=[
+        test_points_spec,
+        tf.TensorSpec(shape=[test_points.shape[0], 1], dtype=i_dtype),
+    ],
+)
+def compute_test_errors(x, y_true):
+    """
+    This function will return the error norms of the model on the test points
+    """
+    error = tf.abs(model(x) - y_true)
+    return tf.sqrt(tf.reduce_mean(tf.square(error))), tf.reduce_max(error)
+
+
 loss_array = []  # total loss
 time_array = []  # time taken for each epoch
 
@@ -281,24 +305,26 @@ for epoch in tqdm(range(i_num_epochs)):
     loss_array.append(loss["loss"])
 
     if epoch % 1000 == 0:
-        model_sol = model(test_points).numpy().reshape(-1)
-        error = np.abs(exact_values - model_sol)
-        l_inf_error = np.max(np.abs(error))
+        l2_error, l_inf_error = compute_test_errors(test_points, exact_values_tensor)
         pde_loss = loss["loss_pde"]
         boundary_loss = loss["loss_dirichlet"]
         print(
-            f"Epoch: {epoch}, Loss: {loss['loss'] :.4e}, L2 Error: {np.sqrt(np.mean(error**2)):.4e}, L_inf Error: {l_inf_error:.4e}",
+            f"Epoch: {epoch}, Loss: {loss['loss'] :.4e}, L2 Error: {l2_error:.4e}, L_inf Error: {l_inf_error:.4e}",
             f"PDE Loss: {pde_loss:.4e}, Boundary Loss: {boundary_loss:.4e}",
         )
 
 
 # Get predicted values from the model
-y_pred = model(test_points).numpy()
-y_pred = y_pred.reshape(-1)
+# the model is evaluated eagerly, since it is called only once here and an XLA
+# compile of the forward pass would take longer than the evaluation itself
+y_pred = tf.reshape(model(test_points), [-1]).numpy()
 
 # compute the error
 error = np.abs(exact_values - y_pred)
 
+# triangulate the test points once and reuse it for all the contour plots
+triangulation = mtri.Triangulation(test_points[:, 0], test_points[:, 1])
+
 # plot a 2x2 Grid, loss plot, exact solution, predicted solution and error
 fig, axs = plt.subplots(2, 2, figsize=(10, 8))
 
@@ -311,7 +337,7 @@ axs[0, 0].set_yscale("log")
 
 # exact solution
 # contour plot of the exact solution
-axs[0, 1].tricontourf(test_points[:, 0], test_points[:, 1], exact_values, 100)
+axs[0, 1].tricontourf(triangulation, exact_values, 100)
 axs[0, 1].set_title("Exact Solution")
 axs[0, 1].set_xlabel("x")
 axs[0, 1].set_ylabel("y")
@@ -321,7 +347,7 @@ cbar = plt.colorbar(axs[0, 1].collections[0], ax=axs[0, 1])
 
 # predicted solution
 # contour plot of the predicted solution
-axs[1, 0].tricontourf(test_points[:, 0], test_points[:, 1], y_pred, 100)
+axs[1, 0].tricontourf(triangulation, y_pred, 100)
 axs[1, 0].set_title("Predicted Solution")
 axs[1, 0].set_xlabel("x")
 axs[1, 0].set_ylabel("y")
@@ -330,7 +356,7 @@ cbar = plt.colorbar(axs[1, 0].collections[0], ax=axs[1, 0])
 
 # error plot
 # contour plot of the error
-axs[1, 1].tricontourf(test_points[:, 0], test_points[:, 1], error, 100)
+axs[1, 1].tricontourf(triangulation, error, 100)
 axs[1, 1].set_title("Error")
 axs[1, 1].set_xlabel("x")
 axs[1, 1].set_ylabel("y")
@@ -343,22 +369,18 @@ plt.savefig("results.png")
 
 
 # print error statistics
-l2_error = np.sqrt(np.mean(error**2))
-l1_error = np.mean(np.abs(error))
-l_inf_error = np.max(np.abs(error))
-rel_l2_error = l2_error / np.sqrt(np.mean(exact_values**2))
-rel_l1_error = l1_error / np.mean(np.abs(exact_values))
-rel_l_inf_error = l_inf_error / np.max(np.abs(exact_values))
-
-# print the error statistics in a formatted table
-error_df = pd.DataFrame(
-    {
-        "L2 Error": [l2_error],
-        "L1 Error": [l1_error],
-        "L_inf Error": [l_inf_error],
-        "Relative L2 Error": [rel_l2_error],
-        "Relative L1 Error": [rel_l1_error],
-        "Relative L_inf Error": [rel_l_inf_error],
-    }
+(
+    l2_error,
+    l_inf_error,
+    rel_l2_error,
+    rel_l_inf_error,
+    l1_error,
+    rel_l1_error,
+) = compute_errors_combined(exact_values, y_pred)
+
+# print the error statistics
+print(
+    f"L2 Error: {l2_error:.4e}, L1 Error: {l1_error:.4e}, L_inf Error: {l_inf_error:.4e}",
+    f"Relative L2 Error: {rel_l2_error:.4e}, Relative L1 Error: {rel_l1_error:.4e}, Relative L_inf Error: {rel_l_inf_error:.4e}",
+    sep="\n",
 )
-print(error_df)
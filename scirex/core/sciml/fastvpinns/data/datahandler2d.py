@@ -57,6 +57,7 @@ References:
 
 from ...fe.fespace2d import *
 from ...geometry.geometry_2d import *
+import numpy as np
 import tensorflow as tf
 
 from .datahandler import DataHandler
@@ -111,48 +112,48 @@ class DataHandler2D(DataHandler):
         # call the parent class constructor
         super().__init__(fespace=fespace, domain=domain, dtype=dtype)
 
-        self.shape_val_mat_list = []
-        self.grad_x_mat_list = []
-        self.grad_y_mat_list = []
-        self.x_pde_list = []
-        self.forcing_function_list = []
-
         # check if the given dtype is a valid tensorflow dtype
         if not isinstance(self.dtype, tf.DType):
             raise TypeError("The given dtype is not a valid tensorflow dtype")
 
+        # collect the per cell matrices on the host, so that each quantity is
+        # converted to a tensor (and copied to the device) only once
+        shape_val_mat_list = []
+        grad_x_mat_list = []
+        grad_y_mat_list = []
+        x_pde_list = []
+        forcing_function_list = []
+
         for cell_index in range(self.fespace.n_cells):
-            shape_val_mat = tf.constant(
-                self.fespace.get_shape_function_val(cell_index), dtype=self.dtype
-            )
-            grad_x_mat = tf.constant(
-                self.fespace.get_shape_function_grad_x(cell_index), dtype=self.dtype
-            )
-            grad_y_mat = tf.constant(
-                self.fespace.get_shape_function_grad_y(cell_index), dtype=self.dtype
-            )
-            x_pde = tf.constant(
-                self.fespace.get_quadrature_actual_coordinates(cell_index),
-                dtype=self.dtype,
+            shape_val_mat_list.append(self.fespace.get_shape_function_val(cell_index))
+            grad_x_mat_list.append(self.fespace.get_shape_function_grad_x(cell_index))
+            grad_y_mat_list.append(self.fespace.get_shape_function_grad_y(cell_index))
+            x_pde_list.append(
+                self.fespace.get_quadrature_actual_coordinates(cell_index)
             )
-            forcing_function = tf.constant(
-                self.fespace.get_forcing_function_values(cell_index), dtype=self.dtype
+            forcing_function_list.append(
+                self.fespace.get_forcing_function_values(cell_index)
             )
-            self.shape_val_mat_list.append(shape_val_mat)
-            self.grad_x_mat_list.append(grad_x_mat)
-            self.grad_y_mat_list.append(grad_y_mat)
-            self.x_pde_list.append(x_pde)
-            self.forcing_function_list.append(forcing_function)
 
         # now convert all the shapes into 3D tensors for easy multiplication
         # input tensor - x_pde_list
-        self.x_pde_list = tf.reshape(self.x_pde_list, [-1, 2])
+        self.x_pde_list = tf.constant(
+            np.concatenate(x_pde_list, axis=0).reshape(-1, 2), dtype=self.dtype
+        )
 
-        self.forcing_function_list = tf.concat(self.forcing_function_list, axis=1)
+        self.forcing_function_list = tf.constant(
+            np.concatenate(forcing_function_list, axis=1), dtype=self.dtype
+        )
 
-        self.shape_val_mat_list = tf.stack(self.shape_val_mat_list, axis=0)
-        self.grad_x_mat_list = tf.stack(self.grad_x_mat_list, axis=0)
-        self.grad_y_mat_list = tf.stack(self.grad_y_mat_list, axis=0)
+        self.shape_val_mat_list = tf.constant(
+            np.stack(shape_val_mat_list, axis=0), dtype=self.dtype
+        )
+        self.grad_x_mat_list = tf.constant(
+            np.stack(grad_x_mat_list, axis=0), dtype=self.dtype
+        )
+        self.grad_y_mat_list = tf.constant(
+            np.stack(grad_y_mat_list, axis=0), dtype=self.dtype
+        )
 
         # test points
         self.test_points = None
@@ -85,7 +85,6 @@ import tensorflow as tf
 from ..utils.print_utils import print_table
 
 from pyDOE import lhs
-import pandas as pd
 
 from matplotlib import rc
 from cycler import cycler
@@ -141,6 +140,17 @@ class Fespace2D(Fespace):
 
     Returns:
         None
+
+    Note:
+        The boundary functions in `bound_function_dict` are evaluated with numpy arrays
+        holding all the points of a boundary, not with one point at a time. They must
+        be vectorised: use `np.where` instead of Python branching such as
+        `1.0 if x < 0.5 else 2.0`. A scalar constant, or a list/tuple/array of
+        per-component arrays or constants, is also accepted.
+
+        The same holds for `forcing_function`, which is evaluated with numpy arrays
+        holding all the quadrature points of a cell. It may return an array or a
+        scalar constant.
     """
 
     def __init__(
@@ -406,23 +416,64 @@ class Fespace2D(Fespace):
 
         Returns:
             tuple: The boundary points and their values as numpy arrays.
+
+        Note:
+            The boundary function of each boundary id is called once on all the points
+            of that boundary, so it must accept numpy arrays for x and y. It may return
+            an array of values at the points, a scalar constant, or a list/tuple/array with
+            one entry per component, where each entry is an array or a scalar constant.
+            An array whose last axis is not the number of boundary points is read as one
+            entry per component. If a 1D array has exactly one entry per boundary point,
+            the function is evaluated once more at a single point to tell a constant
+            vector apart from point values.
         """
         x = []
         y = []
         for bound_id, bound_pts in self.boundary_points.items():
             # get the coordinates of the boundary points
-            for pt in bound_pts:
-                pt_new = np.array([pt[0], pt[1]], dtype=np.float64)
-                x.append(pt_new)
-                val = np.array(
-                    self.bound_function_dict[bound_id](pt[0], pt[1]), dtype=np.float64
-                ).reshape(-1, 1)
-                y.append(val)
+            bound_pts = np.asarray(bound_pts, dtype=np.float64).reshape(-1, 2)
+            x.append(bound_pts)
+            # evaluate the boundary function once for all points on this boundary
+            val = self.bound_function_dict[bound_id](bound_pts[:, 0], bound_pts[:, 1])
+            n_pts = bound_pts.shape[0]
+            is_components = isinstance(val, (list, tuple))
+            if isinstance(val, np.ndarray) and val.ndim > 0:
+                if val.dtype == object or val.shape[-1] != n_pts:
+                    is_components = True
+                elif val.ndim == 1 and n_pts > 1:
+                    # a constant vector with as many components as boundary points looks
+                    # like point values, so check the value at a single point
+                    single_val = self.bound_function_dict[bound_id](
+                        bound_pts[0, 0], bound_pts[0, 1]
+                    )
+                    is_components = np.size(single_val) > 1
+            if is_components:
+                # vector valued boundary functions return one entry per component,
+                # and any of them may be a constant
+                val = np.stack(
+                    [
+                        np.broadcast_to(np.asarray(c, dtype=np.float64), (n_pts,))
+                        for c in val
+                    ],
+                    axis=-1,
+                )
+            else:
+                val = np.asarray(val, dtype=np.float64)
+                if val.ndim == 0:
+                    # constant boundary functions return a scalar
+                    val = np.broadcast_to(val, (n_pts,))
+                # arrays of shape (n_components, n_pts) are transposed to point-major
+                val = np.moveaxis(val, -1, 0)
+            # one row per point, with one column per component of the boundary value
+            y.append(val.reshape(n_pts, -1))
+
+        x = np.concatenate(x, axis=0)
+        y = np.concatenate(y, axis=0)
 
         print(f"[INFO] : Total number of Dirichlet boundary points = {len(x)}")
         self.total_dirichlet_dofs = len(x)
-        print(f"[INFO] : Shape of Dirichlet-X = {np.array(x).shape}")
-        print(f"[INFO] : Shape of Y = {np.array(y).shape}")
+        print(f"[INFO] : Shape of Dirichlet-X = {x.shape}")
+        print(f"[INFO] : Shape of Y = {y.shape}")
 
         return x, y
 
@@ -613,9 +664,11 @@ class Fespace2D(Fespace):
 
         Note:
             This function computes the forcing function values at the quadrature points for a given cell.
-            It loops over all the basis functions and computes the integral using the actual coordinates
-            and the basis functions at the quadrature points. The resulting values are stored in the
-            `forcing_at_quad` attribute of the corresponding `fe_cell` object.
+            The forcing function is evaluated once on all the actual quadrature coordinates of the cell,
+            so it must accept numpy arrays for x and y (a scalar constant return value is broadcast),
+            and the integral against every basis function is obtained with a single matrix-vector product.
+            The resulting values are stored in the `forcing_at_quad` attribute of the corresponding
+            `fe_cell` object.
         """
         if cell_index >= len(self.fe_cell) or cell_index < 0:
             raise ValueError(
@@ -625,28 +678,23 @@ class Fespace2D(Fespace):
         # Changed by Thivin: To assemble the forcing function at the quadrature points here in the fespace
         # so that it can be used to handle multiple dimensions on a vector valud problem
 
-        # get number of shape functions
-        n_shape_functions = self.fe_cell[cell_index].basis_function.num_shape_functions
-
-        # Loop over all the basis functions and compute the integral
-        f_integral = np.zeros((n_shape_functions, 1), dtype=np.float64)
-
-        for i in range(n_shape_functions):
-            val = 0
-            for q in range(self.fe_cell[cell_index].basis_at_quad.shape[1]):
-                x = self.fe_cell[cell_index].quad_actual_coordinates[q, 0]
-                y = self.fe_cell[cell_index].quad_actual_coordinates[q, 1]
-                # print("f_values[q] = ",f_values[q])
+        # get the coordinates
+        x = self.fe_cell[cell_index].quad_actual_coordinates[:, 0]
+        y = self.fe_cell[cell_index].quad_actual_coordinates[:, 1]
 
-                # the Jacobian and the quadrature weights are pre multiplied to the basis functions
-                val += (self.fe_cell[cell_index].basis_at_quad[i, q]) * self.fe_cell[
-                    cell_index
-                ].forcing_function(x, y)
-                # print("val = ", val)
+        # evaluate the forcing function on all quadrature points at once
+        # broadcast so that constant valued forcing functions are also supported
+        f_values = np.broadcast_to(
+            np.asarray(
+                self.fe_cell[cell_index].forcing_function(x, y), dtype=np.float64
+            ),
+            x.shape,
+        )
 
-            f_integral[i] = val
+        # the Jacobian and the quadrature weights are pre multiplied to the basis functions
+        f_integral = np.dot(self.fe_cell[cell_index].basis_at_quad, f_values)
 
-        self.fe_cell[cell_index].forcing_at_quad = f_integral
+        self.fe_cell[cell_index].forcing_at_quad = f_integral.reshape(-1, 1)
 
         return self.fe_cell[cell_index].forcing_at_quad.copy()
 
@@ -749,6 +797,9 @@ class Fespace2D(Fespace):
             This method reads the sensor data from a file and samples `num_points` from the data.
             The sensor data is then returned as a tuple containing the sensor points and the exact solution values.
         """
+        # pandas is only needed here, so it is not imported with the module
+        import pandas as pd
+
         # use pandas to read the file
         df = pd.read_csv(file_name)
 
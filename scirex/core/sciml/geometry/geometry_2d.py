@@ -213,6 +213,8 @@ class Geometry_2D(Geometry):
         """
 
         self.mesh_file_name = mesh_file
+        # the test points of a previous mesh are no longer valid
+        self.test_points = None
 
         # bd_sampling_method = "uniform"  # "uniform" or "lhs"
 
@@ -350,6 +352,8 @@ class Geometry_2D(Geometry):
         self.n_cells_y = n_cells_y
         self.x_limits = x_limits
         self.y_limits = y_limits
+        # the test points of a previous mesh are no longer valid
+        self.test_points = None
 
         # generate linspace of points in x and y direction
         x = np.linspace(x_limits[0], x_limits[1], n_cells_x + 1)
@@ -541,8 +545,17 @@ class Geometry_2D(Geometry):
 
         Returns:
             test_points (np.ndarray): Array of test points
+
+        Note:
+            The test points are cached on the first call, so repeated calls
+            do not regenerate the grid or re-read the VTK file. The cache is
+            reset whenever a new mesh is read or generated. A copy of the cached
+            points is returned, so callers may modify it freely.
         """
 
+        if self.test_points is not None:
+            return self.test_points.copy()
+
         if self.mesh_generation_method == "internal":
             # vtk_file_name  = Path(self.output_folder) / "internal.vtk"
             # code over written to plot from np.linspace instead of vtk file
@@ -554,14 +567,16 @@ class Geometry_2D(Geometry):
             # stack the points
             self.test_points = np.vstack([x_grid.flatten(), y_grid.flatten()]).T
 
-            return self.test_points
+            return self.test_points.copy()
 
         elif self.mesh_generation_method == "external":
             vtk_file_name = Path(self.output_folder) / "external.vtk"
 
         mesh = meshio.read(str(vtk_file_name))
         points = mesh.points
-        return points[:, 0:2]  # return only first two columns
+        self.test_points = points[:, 0:2]  # keep only first two columns
+
+        return self.test_points.copy()
 
     def write_vtk(
         self, solution: np.ndarray, output_path: str, filename: str, data_names: list
@@ -612,8 +627,9 @@ class Geometry_2D(Geometry):
             for i in range(solution.shape[1]):
                 FN.write("SCALARS " + data_names[i] + " float\n")
                 FN.write("LOOKUP_TABLE default\n")
-                np.savetxt(FN, solution[:, i])
-                FN.write("\n")
+                # format the column in C, in the same layout as np.savetxt
+                solution[:, i].tofile(FN, sep="\n", format="%.18e")
+                FN.write("\n\n")
 
         # save the vtk file as image
         # self.save_vtk_as_image(str(output_file_name), data_names)
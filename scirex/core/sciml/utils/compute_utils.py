@@ -222,25 +222,41 @@ def compute_errors_combined(u_exact: np.ndarray, u_approx: np.ndarray) -> np.nda
 
     Returns:
         tuple: The L1, L2 and L_inf absolute and relative errors
+
+    Note:
+        The pointwise error and the magnitude of the exact solution are computed
+        only once and shared between all the norms, instead of calling the
+        individual error functions which recompute them for every norm.
     """
     # flatten the arrays
     u_exact = u_exact.flatten()
     u_approx = u_approx.flatten()
 
+    # compute the pointwise error and the magnitude of the exact solution once
+    error = u_exact - u_approx
+    abs_error = np.abs(error)
+    abs_exact = np.abs(u_exact)
+
+    # the sum of squares is obtained as a dot product, which avoids a temporary array
+    n_points = u_exact.size
+    exact_l2_norm = np.sqrt(np.dot(u_exact, u_exact) / n_points)
+    exact_linf_norm = np.max(abs_exact)
+    exact_l1_norm = np.mean(abs_exact)
+
     # compute the L2 error
-    l2_error = compute_l2_error(u_exact, u_approx)
+    l2_error = np.sqrt(np.dot(error, error) / n_points)
     # compute the L_inf error
-    linf_error = compute_linf_error(u_exact, u_approx)
+    linf_error = np.max(abs_error)
     # compute the relative L2 error
-    l2_error_relative = compute_l2_error_relative(u_exact, u_approx)
+    l2_error_relative = l2_error / exact_l2_norm
     # compute the relative L_inf error
-    linf_error_relative = compute_linf_error_relative(u_exact, u_approx)
+    linf_error_relative = linf_error / exact_linf_norm
 
     # compute L1 Error
-    l1_error = compute_l1_error(u_exact, u_approx)
+    l1_error = np.mean(abs_error)
 
     # compute the relative L1 error
-    l1_error_relative = compute_l1_error_relative(u_exact, u_approx)
+    l1_error_relative = l1_error / exact_l1_norm
 
     return (
         l2_error,
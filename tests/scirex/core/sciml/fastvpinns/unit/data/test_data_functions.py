@@ -36,7 +36,15 @@ from scirex.core.sciml.fe.fespace2d import Fespace2D
 from scirex.core.sciml.fastvpinns.data.datahandler2d import DataHandler2D
 from scirex.core.sciml.fastvpinns.model.model import DenseModel
 from scirex.core.sciml.fastvpinns.physics.cd2d import pde_loss_cd2d
-from scirex.core.sciml.utils.compute_utils import compute_errors_combined
+from scirex.core.sciml.utils.compute_utils import (
+    compute_errors_combined,
+    compute_l1_error,
+    compute_l1_error_relative,
+    compute_l2_error,
+    compute_l2_error_relative,
+    compute_linf_error,
+    compute_linf_error_relative,
+)
 
 
 @pytest.fixture
@@ -317,3 +325,51 @@ def test_num_test_points(setup_results):
         assert test_points.dtype == precision
         # check shape
         assert test_points.shape == (89 * 89, 2)
+
+
+# the individual functions average the squares pairwise with np.mean, while
+# compute_errors_combined uses np.dot, so float32 sums only agree to a few ulps
+@pytest.mark.parametrize(
+    "exact_dtype, approx_dtype, rtol",
+    [
+        (np.float64, np.float64, 1e-12),
+        (np.float32, np.float32, 1e-6),
+        (np.float64, np.float32, 1e-12),
+        (np.float32, np.float64, 1e-6),
+    ],
+)
+@pytest.mark.parametrize("exact_shape", [(-1,), (-1, 1)])
+@pytest.mark.parametrize("approx_shape", [(-1,), (-1, 1)])
+@pytest.mark.parametrize("n_points", [10000, 1000000])
+def test_compute_errors_combined(
+    exact_dtype, approx_dtype, rtol, exact_shape, approx_shape, n_points
+):
+    """
+    Test function for checking compute_errors_combined against the individual error functions.
+    """
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, n_points)
+    u_exact = np.sin(2.0 * np.pi * x) + 0.5
+    u_approx = u_exact + 1e-3 * rng.standard_normal(x.shape)
+
+    u_exact = u_exact.astype(exact_dtype).reshape(exact_shape)
+    u_approx = u_approx.astype(approx_dtype).reshape(approx_shape)
+
+    combined = compute_errors_combined(u_exact, u_approx)
+
+    # the individual functions expect arrays of the same shape
+    u_exact_flat = u_exact.flatten()
+    u_approx_flat = u_approx.flatten()
+    expected = (
+        compute_l2_error(u_exact_flat, u_approx_flat),
+        compute_linf_error(u_exact_flat, u_approx_flat),
+        compute_l2_error_relative(u_exact_flat, u_approx_flat),
+        compute_linf_error_relative(u_exact_flat, u_approx_flat),
+        compute_l1_error(u_exact_flat, u_approx_flat),
+        compute_l1_error_relative(u_exact_flat, u_approx_flat),
+    )
+
+    assert len(combined) == 6
+    for value, expected_value in zip(combined, expected):
+        assert np.ndim(value) == 0
+        assert np.isclose(value, expected_value, rtol=rtol, atol=0.0)
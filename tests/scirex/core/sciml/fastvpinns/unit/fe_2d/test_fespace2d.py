@@ -317,6 +317,100 @@ def test_dirichlet_boundary_data_vector():
     shutil.rmtree("tests/dump")
 
 
+# Test the dirichlet boundary data against a point by point evaluation
+@pytest.mark.parametrize(
+    "bound_function",
+    [
+        lambda x, y: 0.5,  # scalar constant
+        lambda x, y: np.sin(x) + y,  # scalar array
+        lambda x, y: [0.0, 0.0],  # vector constant
+        lambda x, y: [np.sin(x), 0.0],  # mixed vector
+        lambda x, y: [np.sin(x) + y, np.cos(y) * x],  # vector of arrays
+        lambda x, y: np.array([0.0, 0.0]),  # constant vector as an array
+        lambda x, y: np.array([np.sin(x) + y, x * y]),  # (n_comp, n) array
+        lambda x, y: np.array([np.sin(x), 0.0], dtype=object),  # mixed object array
+    ],
+    ids=[
+        "scalar_constant",
+        "scalar_array",
+        "vector_constant",
+        "mixed_vector",
+        "vector_arrays",
+        "vector_constant_array",
+        "component_major_array",
+        "mixed_object_array",
+    ],
+)
+@pytest.mark.parametrize("num_boundary_points", [10, 40])
+def test_dirichlet_boundary_data_pointwise(bound_function, num_boundary_points):
+    """Tests the dirichlet boundary data against a point by point evaluation"""
+
+    # use pathlib to create a temporary directory
+    Path("tests/dump").mkdir(parents=True, exist_ok=True)
+
+    # Define the geometry
+    domain = Geometry_2D("quadrilateral", "internal", 10, 10, "tests/dump")
+    cells, boundary_points = domain.generate_quad_mesh_internal(
+        x_limits=[0, 1],
+        y_limits=[0, 1],
+        n_cells_x=2,
+        n_cells_y=2,
+        num_boundary_points=num_boundary_points,
+    )
+
+    bound_function_dict = {
+        1000: bound_function,
+        1001: bound_function,
+        1002: bound_function,
+        1003: bound_function,
+    }
+    bound_condition_dict = {
+        1000: "dirichlet",
+        1001: "dirichlet",
+        1002: "dirichlet",
+        1003: "dirichlet",
+    }
+    rhs = lambda x, y: np.ones_like(x)
+
+    # Create fespace
+    fespace = Fespace2D(
+        mesh=domain.mesh,
+        cells=cells,
+        boundary_points=boundary_points,
+        cell_type=domain.mesh_type,
+        fe_order=3,
+        fe_type="legendre",
+        quad_order=4,
+        quad_type="gauss-legendre",
+        fe_transformation_type="affine",
+        bound_function_dict=bound_function_dict,
+        bound_condition_dict=bound_condition_dict,
+        forcing_function=rhs,
+        output_path="tests/dump",
+        generate_mesh_plot=False,
+    )
+
+    x, y = fespace.generate_dirichlet_boundary_data()
+
+    # evaluate the boundary function one point at a time
+    expected_x = []
+    expected_y = []
+    for bound_id, bound_pts in boundary_points.items():
+        for pt in bound_pts:
+            expected_x.append([pt[0], pt[1]])
+            expected_y.append(
+                np.asarray(
+                    bound_function_dict[bound_id](pt[0], pt[1]), dtype=np.float64
+                ).reshape(-1)
+            )
+
+    assert np.array_equal(x, np.array(expected_x))
+    assert np.array_equal(y, np.array(expected_y))
+
+    # remove the temporary directory
+    shutil.rmtree("tests/dump")
+
+
 # check the cell number condition on get shape function and gradient routines
 
 
@@ -484,3 +578,75 @@ def test_rhs_vector():
 
     # remove the temporary directory
     shutil.rmtree("tests/dump")
+
+
+# Test the assembled forcing term against the explicit sum over quadrature points
+@pytest.mark.parametrize(
+    "rhs",
+    [
+        lambda x, y: np.sin(np.pi * x) * (y + 1.0),  # varying forcing function
+        lambda x, y: 2.5,  # scalar constant forcing function
+    ],
+    ids=["varying", "scalar_constant"],
+)
+def test_forcing_function_values(rhs):
+    """Tests the forcing term against the explicit sum over the quadrature points"""
+
+    # use pathlib to create a temporary directory
+    Path("tests/dump").mkdir(parents=True, exist_ok=True)
+
+    # Define the geometry
+    domain = Geometry_2D("quadrilateral", "internal", 10, 10, "tests/dump")
+    cells, boundary_points = domain.generate_quad_mesh_internal(
+        x_limits=[0, 1],
+        y_limits=[0, 1],
+        n_cells_x=2,
+        n_cells_y=2,
+        num_boundary_points=10,
+    )
+
+    bound_function_dict = {
+        1000: lambda x, y: np.ones_like(x),
+        1001: lambda x, y: np.ones_like(x),
+        1002: lambda x, y: np.ones_like(x),
+        1003: lambda x, y: np.ones_like(x),
+    }
+    bound_condition_dict = {
+        1000: "dirichlet",
+        1001: "dirichlet",
+        1002: "dirichlet",
+        1003: "dirichlet",
+    }
+
+    # Create fespace
+    fespace = Fespace2D(
+        mesh=domain.mesh,
+        cells=cells,
+        boundary_points=boundary_points,
+        cell_type=domain.mesh_type,
+        fe_order=3,
+        fe_type="legendre",
+        quad_order=4,
+        quad_type="gauss-legendre",
+        fe_transformation_type="bilinear",
+        bound_function_dict=bound_function_dict,
+        bound_condition_dict=bound_condition_dict,
+        forcing_function=rhs,
+        output_path="tests/dump",
+        generate_mesh_plot=False,
+    )
+
+    for cell_index in range(fespace.n_cells):
+        forcing = fespace.get_forcing_function_values(cell_index)
+
+        # sum the forcing function times the basis functions over the quadrature points
+        fe_cell = fespace.fe_cell[cell_index]
+        expected = np.zeros((fe_cell.basis_at_quad.shape[0], 1))
+        for q, (xq, yq) in enumerate(fe_cell.quad_actual_coordinates):
+            expected[:, 0] += fe_cell.basis_at_quad[:, q] * rhs(xq, yq)
+
+        assert forcing.shape == expected.shape
+        assert np.allclose(forcing, expected, rtol=1e-12, atol=1e-14)
+
+    # remove the temporary directory
+    shutil.rmtree("tests/dump")
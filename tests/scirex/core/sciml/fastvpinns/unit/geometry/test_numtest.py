@@ -126,3 +126,45 @@ def test_numtest_points_external():
     assert len(test_points) == 1090
 
     shutil.rmtree("tests/dump")
+
+
+def test_test_points_cached():
+    """
+    Test case for validating that the test points are cached until a new mesh is generated.
+    """
+    Path("tests/dump").mkdir(parents=True, exist_ok=True)
+
+    domain = Geometry_2D("quadrilateral", "internal", 4, 4, "tests/dump")
+    domain.generate_quad_mesh_internal(
+        x_limits=[0, 1],
+        y_limits=[0, 1],
+        n_cells_x=4,
+        n_cells_y=4,
+        num_boundary_points=100,
+    )
+
+    test_points = domain.get_test_points()
+    expected_points = test_points.copy()
+
+    # repeated calls return the same points from the cache
+    assert np.array_equal(domain.get_test_points(), expected_points)
+
+    # changing the returned array in place does not change the cached points
+    test_points *= 10.0
+    test_points += 1.0
+    assert np.array_equal(domain.get_test_points(), expected_points)
+
+    # a new mesh on a different domain invalidates the cache
+    domain.generate_quad_mesh_internal(
+        x_limits=[0, 2],
+        y_limits=[0, 2],
+        n_cells_x=4,
+        n_cells_y=4,
+        num_boundary_points=100,
+    )
+    new_test_points = domain.get_test_points()
+
+    assert not np.array_equal(new_test_points, expected_points)
+    assert np.isclose(new_test_points.max(), 2.0)
+
+    shutil.rmtree("tests/dump")